@@ -2,15 +2,58 @@
 """Convert DataSample.xlsx into src/data/excelDataset.ts."""
 
 from pathlib import Path
-import json
+import functools
+import hashlib
+import io
+import pickle
+import multiprocessing
+import os
+import re
+import sys
+import tempfile
 import zipfile
-import xml.etree.ElementTree as ET
-from collections import defaultdict
+
+import numpy as np
+import orjson
+from lxml import etree
+
+try:
+    import openpyxl
+except ImportError:
+    openpyxl = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 ROOT = Path(__file__).resolve().parents[1]
 XLSX_PATH = ROOT / 'src' / 'data' / 'DataSample.xlsx'
 OUTPUT_PATH = ROOT / 'src' / 'data' / 'excelDataset.ts'
-NS = {'xlsx': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+CACHE_DIR = ROOT / '.cache'
+
+# Decompressed sheet size below which a parallel parse is not worth the fork.
+_PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+# Read-ahead for the streamed zip members; ZipFile.open hands out small reads.
+_ZIP_BUFFER_BYTES = 1 << 20
+
+MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+SI_TAG = MAIN_NS + 'si'
+T_TAG = MAIN_NS + 't'
+ROW_TAG = MAIN_NS + 'row'
+C_TAG = MAIN_NS + 'c'
+V_TAG = MAIN_NS + 'v'
+
+COLUMNS = (
+    'DroneID', 'TimePoint', 'SwarmID', 'TaskID', 'State',
+    'PositionX', 'PositionY', 'PositionZ',
+    'VelocityX', 'VelocityY', 'VelocityZ',
+    'Pitch', 'Roll', 'Yaw',
+    'Battery Percentage', 'Detection Range(Circle)',
+)
+(DRONE_ID, TIME_POINT, SWARM_ID, TASK_ID, STATE,
+ POS_X, POS_Y, POS_Z, VEL_X, VEL_Y, VEL_Z,
+ PITCH, ROLL, YAW, BATTERY, DETECTION) = range(len(COLUMNS))
 
 SWARM_MAPPING = {
     '-1': ('none', 'No Swarm'),
@@ -25,55 +68,248 @@ SWARM_MAPPING = {
 def normalize_state(label: str) -> str:
     return label.strip().lower().replace(' ', '-').replace('_', '-')
 
-def parse_rows():
-    with zipfile.ZipFile(XLSX_PATH) as z:
-        shared_strings = []
-        if 'xl/sharedStrings.xml' in z.namelist():
-            root = ET.fromstring(z.read('xl/sharedStrings.xml'))
-            for si in root.findall('{http://schemas.openxmlformats.org/spreadsheetml/2006/main}si'):
-                text = ''.join(t.text or '' for t in si.findall('.//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}t'))
-                shared_strings.append(text)
-        sheet = ET.fromstring(z.read('xl/worksheets/sheet1.xml'))
-        headers = None
-        for row in sheet.findall('xlsx:sheetData/xlsx:row', NS):
-            values = []
-            for cell in row.findall('xlsx:c', NS):
-                cell_type = cell.get('t')
-                v = cell.find('xlsx:v', NS)
-                if v is None:
-                    value = ''
-                else:
-                    text = v.text or ''
-                    if cell_type == 's':
-                        value = shared_strings[int(text)]
-                    else:
-                        value = text
-                values.append(value)
-            if headers is None:
-                headers = values
-                continue
-            if not values or all((v or '').strip() == '' for v in values):
-                continue
-            row_dict = {headers[i]: (values[i] if i < len(values) else '') for i in range(len(headers))}
-            drone_id = (row_dict.get('DroneID') or '').strip()
-            time_point = (row_dict.get('TimePoint') or '').strip()
+_TP_RE = re.compile(r'^[Tt][Pp](\d+)$')
+
+def tp_key(tp):
+    match = _TP_RE.match(tp)
+    return (0, int(match.group(1))) if match else (1, tp)
+
+@functools.lru_cache(maxsize=None)
+def _state_entry(label):
+    """Map a raw State cell to an interned (state, stateLabel) pair, memoized."""
+    state_label = label.strip() or 'Unknown'
+    return (sys.intern(normalize_state(state_label)), sys.intern(state_label))
+
+def _cell_text(value):
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _parse_rows_openpyxl():
+    wb = openpyxl.load_workbook(XLSX_PATH, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        headers = [_cell_text(v) for v in next(rows, ())]
+        col = {name: idx for idx, name in enumerate(headers)}
+        field_idx = [col.get(name, -1) for name in COLUMNS]
+        for values in rows:
+            record = [values[i] if 0 <= i < len(values) else '' for i in field_idx]
+            for i in range(STATE + 1):
+                record[i] = _cell_text(record[i])
+            drone_id = record[DRONE_ID].strip()
+            time_point = record[TIME_POINT].strip()
             if not drone_id or not time_point or not drone_id.replace('-', '').isdigit():
                 continue
-            yield row_dict
+            yield record
+    finally:
+        wb.close()
+
+def parse_rows():
+    if openpyxl is not None:
+        yield from _parse_rows_openpyxl()
+    else:
+        yield from _parse_rows_xml()
+
+def _read_shared_strings(z):
+    shared_strings = []
+    if 'xl/sharedStrings.xml' in z.namelist():
+        with z.open('xl/sharedStrings.xml') as src:
+            buffered = io.BufferedReader(src, buffer_size=_ZIP_BUFFER_BYTES)
+            for _, si in etree.iterparse(buffered, events=('end',), tag=SI_TAG):
+                shared_strings.append(''.join(t.text or '' for t in si.iter(T_TAG)))
+                si.clear()
+                while si.getprevious() is not None:
+                    del si.getparent()[0]
+    return shared_strings
+
+def _iter_sheet_records(stream, shared_strings, field_idx=None):
+    """Yield validated records from a sheetData XML stream.
+
+    With field_idx=None the first row is taken as the header row and the
+    COLUMNS mapping is resolved from it; otherwise every row is a data row.
+    """
+    sst_get = shared_strings.__getitem__
+
+    def _text(text):
+        return text
+
+    handlers = {'s': lambda text: sst_get(int(text)), 'str': _text, None: _text}
+    get_handler = handlers.get
+
+    # Once the DroneID column position is known, a row can be rejected as soon
+    # as that cell is decoded instead of parsing the remaining columns.
+    did_stop = 0 if field_idx is None else field_idx[DRONE_ID] + 1
+    for _, row in etree.iterparse(stream, events=('end',), tag=ROW_TAG):
+        values = []
+        valid = True
+        for cell in row:
+            if cell.tag != C_TAG:
+                continue
+            v = next((ch for ch in cell if ch.tag == V_TAG), None)
+            if v is None:
+                value = ''
+            else:
+                value = get_handler(cell.get('t'), _text)(v.text or '')
+            values.append(value)
+            if len(values) == did_stop:
+                drone_id = value.strip()
+                if not drone_id or not drone_id.replace('-', '').isdigit():
+                    valid = False
+                    break
+        row.clear()
+        while row.getprevious() is not None:
+            del row.getparent()[0]
+        if field_idx is None:
+            col = {name: idx for idx, name in enumerate(values)}
+            field_idx = [col.get(name, -1) for name in COLUMNS]
+            did_stop = field_idx[DRONE_ID] + 1
+            continue
+        if not valid:
+            continue
+        if not values or all((v or '').strip() == '' for v in values):
+            continue
+        record = [values[i] if 0 <= i < len(values) else '' for i in field_idx]
+        drone_id = record[DRONE_ID].strip()
+        time_point = record[TIME_POINT].strip()
+        if not drone_id or not time_point or not drone_id.replace('-', '').isdigit():
+            continue
+        yield record
+
+def _parse_rows_xml():
+    with zipfile.ZipFile(XLSX_PATH) as z:
+        shared_strings = _read_shared_strings(z)
+        info = z.getinfo('xl/worksheets/sheet1.xml')
+        workers = os.cpu_count() or 1
+        if workers > 1 and info.file_size >= _PARALLEL_MIN_BYTES:
+            yield from _parse_rows_xml_parallel(z, shared_strings, workers)
+            return
+        with z.open('xl/worksheets/sheet1.xml') as src:
+            buffered = io.BufferedReader(src, buffer_size=_ZIP_BUFFER_BYTES)
+            yield from _iter_sheet_records(buffered, shared_strings)
+
+_SHEET_WRAP_OPEN = b'<sheetData xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+_SHEET_WRAP_CLOSE = b'</sheetData>'
+_ROW_START_RE = re.compile(rb'<row[ />]')
+
+_worker_state = {}
+
+def _init_sheet_worker(sheet_path, shared_strings, field_idx):
+    _worker_state['sheet_path'] = sheet_path
+    _worker_state['shared_strings'] = shared_strings
+    _worker_state['field_idx'] = field_idx
+
+def _parse_sheet_chunk(span):
+    start, end = span
+    with open(_worker_state['sheet_path'], 'rb') as f:
+        f.seek(start)
+        chunk = f.read(end - start)
+    stream = io.BytesIO(_SHEET_WRAP_OPEN + chunk + _SHEET_WRAP_CLOSE)
+    return list(_iter_sheet_records(stream, _worker_state['shared_strings'], _worker_state['field_idx']))
+
+def _parse_rows_xml_parallel(z, shared_strings, workers):
+    data = z.read('xl/worksheets/sheet1.xml')
+    row_starts = [m.start() for m in _ROW_START_RE.finditer(data)]
+    if len(row_starts) < 2:
+        yield from _iter_sheet_records(io.BytesIO(data), shared_strings)
+        return
+    try:
+        data_end = data.rindex(_SHEET_WRAP_CLOSE)
+    except ValueError:
+        data_end = len(data)
+
+    # Decode the header row in-process so every worker shares one column mapping.
+    sst_get = shared_strings.__getitem__
+    header_row = etree.fromstring(_SHEET_WRAP_OPEN + data[row_starts[0]:row_starts[1]] + _SHEET_WRAP_CLOSE)[0]
+    headers = []
+    for cell in header_row:
+        if cell.tag != C_TAG:
+            continue
+        v = next((ch for ch in cell if ch.tag == V_TAG), None)
+        text = '' if v is None else (v.text or '')
+        headers.append(sst_get(int(text)) if v is not None and cell.get('t') == 's' else text)
+    col = {name: idx for idx, name in enumerate(headers)}
+    field_idx = [col.get(name, -1) for name in COLUMNS]
+
+    starts = row_starts[1:]
+    step = -(-len(starts) // workers)
+    bounds = [starts[i] for i in range(0, len(starts), step)] + [data_end]
+    spans = list(zip(bounds[:-1], bounds[1:]))
+
+    tmp = tempfile.NamedTemporaryFile(prefix='swarmviz-sheet1-', suffix='.xml', delete=False)
+    try:
+        tmp.write(data)
+        tmp.close()
+        del data
+        with multiprocessing.Pool(workers, initializer=_init_sheet_worker,
+                                  initargs=(tmp.name, shared_strings, field_idx)) as pool:
+            for chunk_records in pool.imap(_parse_sheet_chunk, spans):
+                yield from chunk_records
+    finally:
+        os.unlink(tmp.name)
+
+def _normalize_positions(pos):
+    """Fused min/max scan and in-place x/z scale over the (n, 3) position block.
+
+    Returns (min_x, max_x, min_z, max_z, scale_x, scale_z) from before the
+    rescale so callers can derive spans and the detection scale.
+    """
+    min_x = float(pos[:, 0].min())
+    max_x = float(pos[:, 0].max())
+    min_z = float(pos[:, 2].min())
+    max_z = float(pos[:, 2].max())
+    scale_x = 100.0 / max(max_x - min_x, 1e-6)
+    scale_z = 100.0 / max(max_z - min_z, 1e-6)
+    pos[:, 0] = (pos[:, 0] - min_x) * scale_x
+    pos[:, 2] = (pos[:, 2] - min_z) * scale_z
+    return min_x, max_x, min_z, max_z, scale_x, scale_z
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _normalize_positions(pos):  # noqa: F811 - JIT kernel shadows the numpy fallback
+        n = pos.shape[0]
+        min_x = pos[0, 0]
+        max_x = pos[0, 0]
+        min_z = pos[0, 2]
+        max_z = pos[0, 2]
+        for i in prange(n):
+            min_x = min(min_x, pos[i, 0])
+            max_x = max(max_x, pos[i, 0])
+            min_z = min(min_z, pos[i, 2])
+            max_z = max(max_z, pos[i, 2])
+        scale_x = 100.0 / max(max_x - min_x, 1e-6)
+        scale_z = 100.0 / max(max_z - min_z, 1e-6)
+        for i in prange(n):
+            pos[i, 0] = (pos[i, 0] - min_x) * scale_x
+            pos[i, 2] = (pos[i, 2] - min_z) * scale_z
+        return min_x, max_x, min_z, max_z, scale_x, scale_z
+
+def _count_values(values):
+    uniques, counts = np.unique(np.asarray(values), return_counts=True)
+    return dict(zip(uniques.tolist(), counts.tolist()))
 
 def build_dataset():
     rows = list(parse_rows())
-    timepoints = sorted({row['TimePoint'] for row in rows}, key=lambda tp: int(tp[2:]) if tp.upper().startswith('TP') and tp[2:].isdigit() else tp)
+    keyed = sorted((tp_key(tp), tp) for tp in {row[TIME_POINT] for row in rows})
+    timepoints = [tp for _, tp in keyed]
     timepoint_index = {label: idx for idx, label in enumerate(timepoints)}
     raw_records = []
+    drone_nums = []
+    tp_indices = []
+    # Rows arrive grouped by TimePoint, so a one-label memo avoids hashing the
+    # label into timepoint_index for every record.
+    prev_tp_label = None
+    tp_idx = -1
     for row in rows:
-        swarm_code = row.get('SwarmID', '').strip() or '-1'
+        swarm_code = row[SWARM_ID].strip() or '-1'
         swarm_id, swarm_label = SWARM_MAPPING.get(swarm_code, ('none', 'No Swarm'))
 
-        state_label = (row.get('State') or '').strip() or 'Unknown'
-        normalized_state = normalize_state(state_label)
+        normalized_state, state_label = _state_entry(row[STATE])
 
-        task_code = row.get('TaskID', '').strip() or '-1'
+        task_code = row[TASK_ID].strip() or '-1'
         if task_code == '-1':
             task_id = 'none'
             task_label = 'No Task'
@@ -81,33 +317,23 @@ def build_dataset():
             task_id = normalized_state
             task_label = state_label
 
+        drone_id = row[DRONE_ID].strip()
+        tp_label = row[TIME_POINT]
+        if tp_label != prev_tp_label:
+            tp_idx = timepoint_index[tp_label]
+            prev_tp_label = tp_label
+        drone_nums.append(int(drone_id.split('-')[-1]))
+        tp_indices.append(tp_idx)
         raw_records.append({
-            'droneId': f"drone-{row['DroneID'].strip()}",
-            'timePoint': timepoint_index[row['TimePoint']],
-            'timeLabel': row['TimePoint'],
+            'droneId': f"drone-{drone_id}",
+            'timePoint': tp_idx,
+            'timeLabel': tp_label,
             'swarmId': swarm_id,
             'swarmLabel': swarm_label,
             'taskId': task_id,
             'taskLabel': task_label,
             'state': normalized_state,
             'stateLabel': state_label,
-            'position': {
-                'x': float(row.get('PositionX') or 0),
-                'y': float(row.get('PositionY') or 0),
-                'z': float(row.get('PositionZ') or 0),
-            },
-            'velocity': {
-                'x': float(row.get('VelocityX') or 0),
-                'y': float(row.get('VelocityY') or 0),
-                'z': float(row.get('VelocityZ') or 0),
-            },
-            'orientation': {
-                'pitch': float(row.get('Pitch') or 0),
-                'roll': float(row.get('Roll') or 0),
-                'yaw': float(row.get('Yaw') or 0),
-            },
-            'batteryPercentage': float(row.get('Battery Percentage') or 0),
-            'detectionRange': float(row.get('Detection Range(Circle)') or 0),
         })
 
     if not raw_records:
@@ -129,43 +355,46 @@ def build_dataset():
             },
         }
 
-    min_x = min(rec['position']['x'] for rec in raw_records)
-    max_x = max(rec['position']['x'] for rec in raw_records)
-    min_z = min(rec['position']['z'] for rec in raw_records)
-    max_z = max(rec['position']['z'] for rec in raw_records)
+    n = len(raw_records)
+    numeric = np.fromiter(
+        (float(v) if v else 0.0 for row in rows for v in row[POS_X:]),
+        dtype=np.float64,
+        count=n * (DETECTION - POS_X + 1),
+    ).reshape(n, -1)
+    pos = numeric[:, :3]
+    vel = numeric[:, 3:6]
+    ori = numeric[:, 6:9]
+    sca = numeric[:, 9:]
 
-    span_x = max(max_x - min_x, 1e-6)
-    span_z = max(max_z - min_z, 1e-6)
-
-    scale_x = 100.0 / span_x
-    scale_z = 100.0 / span_z
+    min_x, max_x, min_z, max_z, scale_x, scale_z = _normalize_positions(pos)
     detection_scale = (scale_x + scale_z) / 2.0
+    sca[:, 1] *= detection_scale
+
+    order = np.lexsort((np.asarray(tp_indices), np.asarray(drone_nums)))
+    records = [raw_records[i] for i in order.tolist()]
+    pos = pos[order]
+    vel = vel[order]
+    ori = ori[order]
+    sca = sca[order]
+
+    # After normalization x/z start at 0 and end at span*scale (100 unless the
+    # 1e-6 span guard kicked in), so only y needs scanning.
+    bbox_min = [0.0, float(pos[:, 1].min()), 0.0]
+    bbox_max = [float((max_x - min_x) * scale_x), float(pos[:, 1].max()), float((max_z - min_z) * scale_z)]
+
+    swarm_counts = _count_values([rec['swarmId'] for rec in records])
+    task_counts = _count_values([rec['taskId'] for rec in records])
+    state_counts = _count_values([rec['state'] for rec in records])
+
+    # Flat [x, y, z] / [pitch, roll, yaw] triples: three fewer dict objects per
+    # record in memory and no nested braces/keys in the serialized JSON.
+    for rec, p, v, o, s in zip(records, pos.tolist(), vel.tolist(), ori.tolist(), sca.tolist()):
+        rec['position'] = p
+        rec['velocity'] = v
+        rec['orientation'] = o
+        rec['batteryPercentage'] = s[0]
+        rec['detectionRange'] = s[1]
 
-    for record in raw_records:
-        record['position']['x'] = (record['position']['x'] - min_x) * scale_x
-        record['position']['z'] = (record['position']['z'] - min_z) * scale_z
-        record['detectionRange'] = record['detectionRange'] * detection_scale
-
-    records = sorted(raw_records, key=lambda rec: (int(rec['droneId'].split('-')[-1]), rec['timePoint']))
-
-    swarm_counts = defaultdict(int)
-    task_counts = defaultdict(int)
-    state_counts = defaultdict(int)
-    min_x = min_y = min_z = float('inf')
-    max_x = max_y = max_z = float('-inf')
-    for rec in records:
-        swarm_counts[rec['swarmId']] += 1
-        task_counts[rec['taskId']] += 1
-        state_counts[rec['state']] += 1
-        x = rec['position']['x']
-        y = rec['position']['y']
-        z = rec['position']['z']
-        min_x = min(min_x, x)
-        min_y = min(min_y, y)
-        min_z = min(min_z, z)
-        max_x = max(max_x, x)
-        max_y = max(max_y, y)
-        max_z = max(max_z, z)
     dataset = {
         'timePoints': [timepoint_index[label] for label in timepoints],
         'timePointLabels': timepoints,
@@ -173,31 +402,50 @@ def build_dataset():
         'metadata': {
             'totalDrones': len({rec['droneId'] for rec in records}),
             'totalTimePoints': len(timepoints),
-            'swarmCounts': dict(swarm_counts),
-            'taskCounts': dict(task_counts),
-            'stateCounts': dict(state_counts),
+            'swarmCounts': swarm_counts,
+            'taskCounts': task_counts,
+            'stateCounts': state_counts,
             'boundingBox': {
-                'min': {'x': min_x, 'y': min_y, 'z': min_z},
-                'max': {'x': max_x, 'y': max_y, 'z': max_z},
+                'min': {'x': bbox_min[0], 'y': bbox_min[1], 'z': bbox_min[2]},
+                'max': {'x': bbox_max[0], 'y': bbox_max[1], 'z': bbox_max[2]},
             },
             'swarmLabels': {code: label for code, (_, label) in SWARM_MAPPING.items() if code in SWARM_MAPPING},
         },
     }
     return dataset
 
-def write_dataset():
-    dataset = build_dataset()
-    json_payload = json.dumps(dataset, indent=2)
-    content = """// Drone swarm dataset curated for the Swarmscape visualization dashboard.
+TS_PROLOGUE = """// Drone swarm dataset curated for the Swarmscape visualization dashboard.
 // Run `python3 scripts/generate_dataset_from_excel.py` to refresh.
 
 import { DroneSwarmDataset } from '@/types/drone';
 
-const rawDataset = `REPLACE_ME`;
+const rawDataset = `"""
+
+TS_EPILOGUE = """`;
 
 export const excelDataset = JSON.parse(rawDataset) as DroneSwarmDataset;
-""".replace('REPLACE_ME', json_payload.replace('`', r'\`'))
-    OUTPUT_PATH.write_text(content)
+"""
+
+def _load_or_build_dataset():
+    """Rebuild the dataset only when the workbook bytes change."""
+    digest = hashlib.blake2b(XLSX_PATH.read_bytes(), digest_size=16).hexdigest()
+    cache_path = CACHE_DIR / f'dataset-{digest}.pkl'
+    if cache_path.exists():
+        return pickle.loads(cache_path.read_bytes())
+    dataset = build_dataset()
+    CACHE_DIR.mkdir(exist_ok=True)
+    for stale in CACHE_DIR.glob('dataset-*.pkl'):
+        stale.unlink()
+    cache_path.write_bytes(pickle.dumps(dataset, protocol=pickle.HIGHEST_PROTOCOL))
+    return dataset
+
+def write_dataset():
+    dataset = _load_or_build_dataset()
+    payload = orjson.dumps(dataset, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    with open(OUTPUT_PATH, 'wb') as f:
+        f.write(TS_PROLOGUE.encode('utf-8'))
+        f.write(payload.replace(b'`', b'\\`'))
+        f.write(TS_EPILOGUE.encode('utf-8'))
     print(f'Updated {OUTPUT_PATH.relative_to(ROOT)} with {len(dataset["drones"])} records.')
 
 if __name__ == '__main__':